@@ -14,7 +14,6 @@ def test_remove_email(auth_client, user, email_factory, headless_reverse):
     resp = auth_client.delete(
         headless_reverse("headless:account:manage_email"),
         data={"email": addr.email},
-        content_type="application/json",
     )
     assert resp.status_code == 200
     assert len(resp.json()["data"]) == 1
@@ -26,7 +25,6 @@ def test_add_email(auth_client, user, email_factory, headless_reverse):
     resp = auth_client.post(
         headless_reverse("headless:account:manage_email"),
         data={"email": new_email},
-        content_type="application/json",
     )
     assert resp.status_code == 200
     assert len(resp.json()["data"]) == 2
@@ -40,7 +38,6 @@ def test_change_primary(auth_client, user, email_factory, headless_reverse):
     resp = auth_client.patch(
         headless_reverse("headless:account:manage_email"),
         data={"email": addr.email, "primary": True},
-        content_type="application/json",
     )
     assert resp.status_code == 200
     assert len(resp.json()["data"]) == 2
@@ -54,7 +51,6 @@ def test_resend_verification(
     resp = auth_client.put(
         headless_reverse("headless:account:manage_email"),
         data={"email": addr.email},
-        content_type="application/json",
     )
     assert resp.status_code == 200
     assert len(mailoutbox) == 1
@@ -69,7 +65,6 @@ def test_email_rate_limit(
         resp = auth_client.post(
             headless_reverse("headless:account:manage_email"),
             data={"email": new_email},
-            content_type="application/json",
         )
         expected_status = 200 if attempt == 0 else 429
         assert resp.status_code == expected_status
@@ -93,7 +88,6 @@ def test_resend_verification_rate_limit(
         resp = auth_client.put(
             headless_reverse("headless:account:manage_email"),
             data={"email": addr.email},
-            content_type="application/json",
         )
         assert resp.status_code == 403 if attempt else 200
         assert len(mailoutbox) == 1
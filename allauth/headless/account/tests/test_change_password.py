@@ -1,26 +1,94 @@
 import copy
 from unittest.mock import ANY
 
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+
 import pytest
 
 
+PASSWORD_CHANGED = {
+    "status": 200,
+    "meta": {"is_authenticated": True},
+    "data": {
+        "user": ANY,
+        "methods": [],
+    },
+}
+
+ENTER_CURRENT_PASSWORD = {
+    "status": 400,
+    "errors": [
+        {
+            "param": "current_password",
+            "message": "Please type your current password.",
+            "code": "enter_current_password",
+        }
+    ],
+}
+
+NEW_PASSWORD_TOO_SHORT = {
+    "status": 400,
+    "errors": [
+        {
+            "param": "new_password",
+            "code": "password_too_short",
+            "message": "This password is too short. It must contain at least 6 characters.",
+        }
+    ],
+}
+
+NEW_PASSWORD_REQUIRED = {
+    "status": 400,
+    "errors": [
+        {
+            "param": "new_password",
+            "code": "required",
+            "message": "This field is required.",
+        }
+    ],
+}
+
+CURRENT_PASSWORD_REQUIRED = {
+    "status": 400,
+    "errors": [
+        {
+            "param": "current_password",
+            "message": "This field is required.",
+            "code": "required",
+        }
+    ],
+}
+
+
+@pytest.fixture
+def request_data(request, user_password, password_factory):
+    data = copy.deepcopy(request.param)
+    if data.get("current_password") == "{user_password}":
+        data["current_password"] = user_password
+    if data.get("new_password") == "{password_factory}":
+        data["new_password"] = password_factory()
+    return data
+
+
+@pytest.fixture
+def password_auth_client(request, client, user):
+    has_password = request.param
+    if not has_password:
+        get_user_model().objects.filter(pk=user.pk).update(password=make_password(None))
+        user.refresh_from_db(fields=["password"])
+    client.force_login(user)
+    return client
+
+
 @pytest.mark.parametrize(
-    "has_password,request_data,response_data,status_code",
+    "password_auth_client,request_data,response_data,status_code",
     [
         # Wrong current password
         (
             True,
             {"current_password": "wrong", "new_password": "{password_factory}"},
-            {
-                "status": 400,
-                "errors": [
-                    {
-                        "param": "current_password",
-                        "message": "Please type your current password.",
-                        "code": "enter_current_password",
-                    }
-                ],
-            },
+            ENTER_CURRENT_PASSWORD,
             400,
         ),
         # Happy flow, regular password change
@@ -30,14 +98,7 @@ import pytest
                 "current_password": "{user_password}",
                 "new_password": "{password_factory}",
             },
-            {
-                "status": 200,
-                "meta": {"is_authenticated": True},
-                "data": {
-                    "user": ANY,
-                    "methods": [],
-                },
-            },
+            PASSWORD_CHANGED,
             200,
         ),
         # New password does not match constraints
@@ -47,16 +108,7 @@ import pytest
                 "current_password": "{user_password}",
                 "new_password": "a",
             },
-            {
-                "status": 400,
-                "errors": [
-                    {
-                        "param": "new_password",
-                        "code": "password_too_short",
-                        "message": "This password is too short. It must contain at least 6 characters.",
-                    }
-                ],
-            },
+            NEW_PASSWORD_TOO_SHORT,
             400,
         ),
         # New password not empty
@@ -66,16 +118,7 @@ import pytest
                 "current_password": "{user_password}",
                 "new_password": "",
             },
-            {
-                "status": 400,
-                "errors": [
-                    {
-                        "param": "new_password",
-                        "code": "required",
-                        "message": "This field is required.",
-                    }
-                ],
-            },
+            NEW_PASSWORD_REQUIRED,
             400,
         ),
         # Current password not blank
@@ -85,16 +128,7 @@ import pytest
                 "current_password": "",
                 "new_password": "{password_factory}",
             },
-            {
-                "status": 400,
-                "errors": [
-                    {
-                        "param": "current_password",
-                        "message": "This field is required.",
-                        "code": "required",
-                    }
-                ],
-            },
+            CURRENT_PASSWORD_REQUIRED,
             400,
         ),
         # Current password missing
@@ -103,16 +137,7 @@ import pytest
             {
                 "new_password": "{password_factory}",
             },
-            {
-                "status": 400,
-                "errors": [
-                    {
-                        "param": "current_password",
-                        "message": "This field is required.",
-                        "code": "required",
-                    }
-                ],
-            },
+            CURRENT_PASSWORD_REQUIRED,
             400,
         ),
         # Current password not set, happy flow
@@ -122,14 +147,7 @@ import pytest
                 "current_password": "",
                 "new_password": "{password_factory}",
             },
-            {
-                "status": 200,
-                "meta": {"is_authenticated": True},
-                "data": {
-                    "user": ANY,
-                    "methods": [],
-                },
-            },
+            PASSWORD_CHANGED,
             200,
         ),
         # Current password not set, current_password absent
@@ -138,60 +156,51 @@ import pytest
             {
                 "new_password": "{password_factory}",
             },
-            {
-                "status": 200,
-                "meta": {"is_authenticated": True},
-                "data": {
-                    "user": ANY,
-                    "methods": [],
-                },
-            },
+            PASSWORD_CHANGED,
             200,
         ),
     ],
+    ids=[
+        "wrong_current",
+        "happy_change",
+        "new_too_short",
+        "new_empty",
+        "current_empty",
+        "current_missing",
+        "unusable_happy",
+        "unusable_absent",
+    ],
+    indirect=["password_auth_client", "request_data"],
 )
 def test_change_password(
-    auth_client,
+    password_auth_client,
     user,
     request_data,
     response_data,
     status_code,
-    has_password,
     user_password,
-    password_factory,
     settings,
     mailoutbox,
     headless_reverse,
     headless_client,
 ):
-    request_data = copy.deepcopy(request_data)
-    response_data = copy.deepcopy(response_data)
     settings.ACCOUNT_EMAIL_NOTIFICATIONS = True
-    if not has_password:
-        user.set_unusable_password()
-        user.save(update_fields=["password"])
-        auth_client.force_login(user)
-    if request_data.get("current_password") == "{user_password}":
-        request_data["current_password"] = user_password
-    if request_data.get("new_password") == "{password_factory}":
-        request_data["new_password"] = password_factory()
-    resp = auth_client.post(
-        headless_reverse("headless:account:change_password"),
-        data=request_data,
-        content_type="application/json",
+    initial = len(mailoutbox)
+    resp = password_auth_client.post(
+        headless_reverse("headless:account:change_password"), data=request_data
     )
     assert resp.status_code == status_code
     resp_json = resp.json()
     if headless_client == "app" and resp.status_code == 200:
-        response_data["meta"]["session_token"] = ANY
+        assert resp_json["meta"].pop("session_token")
     assert resp_json == response_data
     user.refresh_from_db()
     if resp.status_code == 200:
         assert user.check_password(request_data["new_password"])
-        assert len(mailoutbox) == 1
+        assert len(mailoutbox) - initial == 1
     else:
         assert user.check_password(user_password)
-        assert len(mailoutbox) == 0
+        assert len(mailoutbox) == initial
 
 
 def test_change_password_rate_limit(
@@ -212,7 +221,6 @@ def test_change_password_rate_limit(
                 "current_password": user_password,
                 "new_password": new_password,
             },
-            content_type="application/json",
         )
         user_password = new_password
         expected_status = 200 if attempt == 0 else 429
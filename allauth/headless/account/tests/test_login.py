@@ -1,13 +1,33 @@
+import json
 from unittest.mock import ANY
 
+from django.contrib.auth import get_user_model
+
 import pytest
 
 
-def test_auth_password_input_error(headless_reverse, client):
+EMAIL_PASSWORD_MISMATCH_ERROR = {
+    "param": "password",
+    "message": "The email address and/or password you specified are not correct.",
+    "code": "email_password_mismatch",
+}
+
+
+pytestmark = pytest.mark.usefixtures("email_authentication")
+
+
+@pytest.fixture
+def is_active(request, user):
+    get_user_model().objects.filter(pk=user.pk).update(is_active=request.param)
+    user.refresh_from_db(fields=["is_active"])
+    return user.is_active
+
+
+def test_auth_password_input_error(headless_reverse, client, settings):
+    settings.ACCOUNT_AUTHENTICATION_METHOD = "username"
     resp = client.post(
         headless_reverse("headless:account:login"),
         data={},
-        content_type="application/json",
     )
     assert resp.status_code == 400
     assert resp.json() == {
@@ -27,88 +47,81 @@ def test_auth_password_input_error(headless_reverse, client):
     }
 
 
-def test_auth_password_bad_password(headless_reverse, client, user, settings):
-    settings.ACCOUNT_AUTHENTICATION_METHOD = "email"
+def test_auth_password_bad_password(headless_reverse, client, user):
     resp = client.post(
         headless_reverse("headless:account:login"),
         data={
             "email": user.email,
             "password": "wrong",
         },
-        content_type="application/json",
     )
     assert resp.status_code == 400
     assert resp.json() == {
         "status": 400,
-        "errors": [
-            {
-                "param": "password",
-                "message": "The email address and/or password you specified are not correct.",
-                "code": "email_password_mismatch",
-            }
-        ],
+        "errors": [EMAIL_PASSWORD_MISMATCH_ERROR],
     }
 
 
 def test_auth_password_success(
-    client, user, user_password, settings, headless_reverse, headless_client
+    client, user, user_password, headless_reverse, headless_client
 ):
-    settings.ACCOUNT_AUTHENTICATION_METHOD = "email"
     login_resp = client.post(
         headless_reverse("headless:account:login"),
         data={
             "email": user.email,
             "password": user_password,
         },
-        content_type="application/json",
     )
     assert login_resp.status_code == 200
-    session_resp = client.get(
-        headless_reverse("headless:account:current_session"),
-        content_type="application/json",
-    )
-    assert session_resp.status_code == 200
-    for resp in [login_resp, session_resp]:
-        extra_meta = {}
-        if headless_client == "app" and resp == login_resp:
-            # The session is created on first login, and hence the token is
-            # exposed only at that moment.
-            extra_meta["session_token"] = ANY
-        assert resp.json() == {
-            "status": 200,
-            "data": {
-                "user": {
-                    "id": user.pk,
-                    "display": str(user),
-                    "email": user.email,
-                    "username": user.username,
-                    "has_usable_password": True,
-                },
-                "methods": [
-                    {
-                        "at": ANY,
-                        "email": user.email,
-                        "method": "password",
-                    }
-                ],
+    extra_meta = {}
+    if headless_client == "app":
+        # The session is created on first login, and hence the token is
+        # exposed only at that moment.
+        extra_meta["session_token"] = ANY
+    login_data = login_resp.json()
+    assert login_data == {
+        "status": 200,
+        "data": {
+            "user": {
+                "id": user.pk,
+                "display": str(user),
+                "email": user.email,
+                "username": user.username,
+                "has_usable_password": True,
             },
-            "meta": {"is_authenticated": True, **extra_meta},
-        }
+            "methods": [
+                {
+                    "at": ANY,
+                    "email": user.email,
+                    "method": "password",
+                }
+            ],
+        },
+        "meta": {"is_authenticated": True, **extra_meta},
+    }
+    # The session endpoint serves the same payload, minus the token.
+    session_resp = client.get(headless_reverse("headless:account:current_session"))
+    assert session_resp.status_code == 200
+    assert session_resp.json() == {
+        "status": 200,
+        "data": login_data["data"],
+        "meta": {"is_authenticated": True},
+    }
 
 
-@pytest.mark.parametrize("is_active,status_code", [(False, 401), (True, 200)])
+@pytest.mark.parametrize(
+    "is_active,status_code", [(False, 401), (True, 200)], indirect=["is_active"]
+)
 def test_auth_password_user_inactive(
     client, user, user_password, settings, status_code, is_active, headless_reverse
 ):
-    user.is_active = is_active
-    user.save(update_fields=["is_active"])
+    settings.ACCOUNT_AUTHENTICATION_METHOD = "username"
     resp = client.post(
         headless_reverse("headless:account:login"),
         data={
             "username": user.username,
             "password": user_password,
         },
-        content_type="application/json",
     )
     assert resp.status_code == status_code
 
@@ -122,24 +135,14 @@ def test_login_failed_rate_limit(
     enable_cache,
 ):
     settings.ACCOUNT_RATE_LIMITS = {"login_failed": "1/m/ip"}
-    settings.ACCOUNT_AUTHENTICATION_METHOD = "email"
+    url = headless_reverse("headless:account:login")
+    data = json.dumps({"email": user.email, "password": "wrong"})
     for attempt in range(2):
-        resp = client.post(
-            headless_reverse("headless:account:login"),
-            data={
-                "email": user.email,
-                "password": "wrong",
-            },
-            content_type="application/json",
-        )
+        resp = client.post(url, data=data)
         assert resp.status_code == 400
         assert resp.json()["errors"] == [
             (
-                {
-                    "code": "email_password_mismatch",
-                    "message": "The email address and/or password you specified are not correct.",
-                    "param": "password",
-                }
+                EMAIL_PASSWORD_MISMATCH_ERROR
                 if attempt == 0
                 else {
                     "message": "Too many failed login attempts. Try again later.",
@@ -159,15 +162,9 @@ def test_login_rate_limit(
     enable_cache,
 ):
     settings.ACCOUNT_RATE_LIMITS = {"login": "1/m/ip"}
-    settings.ACCOUNT_AUTHENTICATION_METHOD = "email"
+    url = headless_reverse("headless:account:login")
+    data = json.dumps({"email": user.email, "password": user_password})
     for attempt in range(2):
-        resp = client.post(
-            headless_reverse("headless:account:login"),
-            data={
-                "email": user.email,
-                "password": user_password,
-            },
-            content_type="application/json",
-        )
+        resp = client.post(url, data=data)
         expected_status = 429 if attempt else 200
         assert resp.status_code == expected_status
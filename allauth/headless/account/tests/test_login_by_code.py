@@ -5,7 +5,6 @@ def test_login_by_code(headless_reverse, user, client, mailoutbox):
     resp = client.post(
         headless_reverse("headless:account:request_login_code"),
         data={"email": user.email},
-        content_type="application/json",
     )
     assert resp.status_code == 401
     data = resp.json()
@@ -17,7 +16,6 @@ def test_login_by_code(headless_reverse, user, client, mailoutbox):
     resp = client.post(
         headless_reverse("headless:account:confirm_login_code"),
         data={"code": code},
-        content_type="application/json",
     )
     assert resp.status_code == 200
     data = resp.json()
@@ -32,7 +30,6 @@ def test_login_by_code_rate_limit(
         resp = client.post(
             headless_reverse("headless:account:request_login_code"),
             data={"email": user.email},
-            content_type="application/json",
         )
         expected_code = 400 if attempt else 401
         assert resp.status_code == expected_code
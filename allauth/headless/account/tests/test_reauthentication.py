@@ -3,7 +3,6 @@ def test_reauthenticate(
 ):
     resp = auth_client.get(
         headless_reverse("headless:account:current_session"),
-        content_type="application/json",
     )
     assert resp.status_code == 200
     data = resp.json()
@@ -14,13 +13,11 @@ def test_reauthenticate(
         data={
             "password": user_password,
         },
-        content_type="application/json",
     )
     assert resp.status_code == 200
 
     resp = auth_client.get(
         headless_reverse("headless:account:current_session"),
-        content_type="application/json",
     )
     assert resp.status_code == 200
     data = resp.json()
@@ -45,7 +42,6 @@ def test_reauthenticate_rate_limit(
             data={
                 "password": user_password,
             },
-            content_type="application/json",
         )
         expected_status = 429 if attempt else 200
         assert resp.status_code == expected_status
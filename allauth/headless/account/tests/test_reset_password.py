@@ -1,26 +1,40 @@
+import json
+
 from django.urls import reverse
 
 import pytest
 
+from allauth.account.utils import user_pk_to_url_str
 
-def test_password_reset_flow(
-    client, user, mailoutbox, password_factory, settings, headless_reverse
-):
-    settings.ACCOUNT_EMAIL_NOTIFICATIONS = True
 
+def test_password_reset_email_is_sent(client, user, mailoutbox, headless_reverse):
+    initial = len(mailoutbox)
     resp = client.post(
         headless_reverse("headless:account:request_password_reset"),
         data={
             "email": user.email,
         },
-        content_type="application/json",
     )
     assert resp.status_code == 200
-    assert len(mailoutbox) == 1
-    body = mailoutbox[0].body
-    # Extract URL for `password_reset_from_key` view
-    url = body[body.find("/password/reset/") :].split()[0]
-    key = url.split("/")[-2]
+    assert len(mailoutbox) - initial == 1
+    assert mailoutbox[initial].to == [user.email]
+    body = mailoutbox[initial].body
+    assert "/password/reset/" in body
+    assert f"/{user_pk_to_url_str(user)}-" in body
+
+
+def test_password_reset_flow(
+    client,
+    user,
+    mailoutbox,
+    password_factory,
+    settings,
+    headless_reverse,
+    password_reset_key_generator,
+):
+    settings.ACCOUNT_EMAIL_NOTIFICATIONS = True
+    initial = len(mailoutbox)
+    key = password_reset_key_generator(user)
     password = password_factory()
 
     # Too simple password
@@ -30,7 +44,6 @@ def test_password_reset_flow(
             "key": key,
             "password": "a",
         },
-        content_type="application/json",
     )
     assert resp.status_code == 400
     assert resp.json() == {
@@ -43,7 +56,7 @@ def test_password_reset_flow(
         ],
     }
 
-    assert len(mailoutbox) == 1
+    assert len(mailoutbox) == initial
 
     # Success
     resp = client.post(
@@ -52,13 +65,12 @@ def test_password_reset_flow(
             "key": key,
             "password": password,
         },
-        content_type="application/json",
     )
     assert resp.status_code == 401
 
     user.refresh_from_db()
     assert user.check_password(password)
-    assert len(mailoutbox) == 2  # The security notification
+    assert len(mailoutbox) - initial == 1  # The security notification
 
 
 @pytest.mark.parametrize("method", ["get", "post"])
@@ -79,7 +91,6 @@ def test_password_reset_flow_wrong_key(
                 "key": "wrong",
                 "password": password,
             },
-            content_type="application/json",
         )
     assert resp.status_code == 400
     assert resp.json() == {
@@ -102,7 +113,6 @@ def test_password_reset_flow_unknown_user(
         data={
             "email": "not@registered.org",
         },
-        content_type="application/json",
     )
     assert resp.status_code == 200
     assert len(mailoutbox) == 1
@@ -117,12 +127,10 @@ def test_reset_password_rate_limit(
     auth_client, user, headless_reverse, settings, enable_cache
 ):
     settings.ACCOUNT_RATE_LIMITS = {"reset_password": "1/m/ip"}
+    url = headless_reverse("headless:account:request_password_reset")
+    data = json.dumps({"email": user.email})
     for attempt in range(2):
-        resp = auth_client.post(
-            headless_reverse("headless:account:request_password_reset"),
-            data={"email": user.email},
-            content_type="application/json",
-        )
+        resp = auth_client.post(url, data=data)
         expected_status = 200 if attempt == 0 else 429
         assert resp.status_code == expected_status
         assert resp.json()["status"] == expected_status
@@ -137,15 +145,15 @@ def test_password_reset_key_rate_limit(
     enable_cache,
 ):
     settings.ACCOUNT_RATE_LIMITS = {"reset_password_from_key": "1/m/ip"}
+    url = headless_reverse("headless:account:reset_password")
+    data = json.dumps(
+        {
+            "key": password_reset_key_generator(user),
+            "password": "a",  # too short
+        }
+    )
     for attempt in range(2):
-        resp = client.post(
-            headless_reverse("headless:account:reset_password"),
-            data={
-                "key": password_reset_key_generator(user),
-                "password": "a",  # too short
-            },
-            content_type="application/json",
-        )
+        resp = client.post(url, data=data)
         expected_status = 429 if attempt else 400
         assert resp.status_code == expected_status
         assert resp.json()["status"] == expected_status
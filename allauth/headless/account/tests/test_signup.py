@@ -22,7 +22,6 @@ def test_signup(
             "email": email_factory(),
             "password": password_factory(),
         },
-        content_type="application/json",
     )
     assert resp.status_code == 200
     assert User.objects.filter(username="wizard").exists()
@@ -46,7 +45,6 @@ def test_signup_with_email_verification(
             "email": email,
             "password": password_factory(),
         },
-        content_type="application/json",
     )
     assert resp.status_code == 401
     assert User.objects.filter(email=email).exists()
@@ -71,7 +69,6 @@ def test_signup_with_email_verification(
     resp = client.post(
         headless_reverse("headless:account:verify_email"),
         data={"key": key},
-        content_type="application/json",
     )
     assert resp.status_code == 200
     data = resp.json()
@@ -100,7 +97,6 @@ def test_signup_prevent_enumeration(
             "email": user.email,
             "password": password_factory(),
         },
-        content_type="application/json",
     )
     assert len(mailoutbox) == 1
     assert "an account using that email address already exists" in mailoutbox[0].body
@@ -135,7 +131,6 @@ def test_signup_rate_limit(
                 "email": email_factory(),
                 "password": password_factory(),
             },
-            content_type="application/json",
         )
         expected_status = 429 if attempt else 200
         assert resp.status_code == expected_status
@@ -162,7 +157,6 @@ def test_signup_closed(
                 "email": email_factory(),
                 "password": password_factory(),
             },
-            content_type="application/json",
         )
     assert resp.status_code == 403
     assert not User.objects.filter(username="wizard").exists()
@@ -184,7 +178,6 @@ def test_signup_while_logged_in(
             "email": email_factory(),
             "password": password_factory(),
         },
-        content_type="application/json",
     )
     assert resp.status_code == 409
     assert resp.json() == {"status": 409}
@@ -1,3 +1,4 @@
+from django.test import override_settings
 from django.test.client import Client
 from django.urls import reverse
 
@@ -18,7 +19,31 @@ def headless_reverse(headless_client):
     return rev
 
 
-class AppClient(Client):
+@pytest.fixture(scope="module")
+def email_authentication():
+    with override_settings(ACCOUNT_AUTHENTICATION_METHOD="email"):
+        yield
+
+
+class JSONClient(Client):
+    """
+    The headless API speaks JSON, so send JSON unless told otherwise.
+    """
+
+    def post(self, path, data=None, content_type="application/json", **kwargs):
+        return super().post(path, data=data, content_type=content_type, **kwargs)
+
+    def put(self, path, data="", content_type="application/json", **kwargs):
+        return super().put(path, data=data, content_type=content_type, **kwargs)
+
+    def patch(self, path, data="", content_type="application/json", **kwargs):
+        return super().patch(path, data=data, content_type=content_type, **kwargs)
+
+    def delete(self, path, data="", content_type="application/json", **kwargs):
+        return super().delete(path, data=data, content_type=content_type, **kwargs)
+
+
+class AppClient(JSONClient):
     session_token = None
 
     def generic(self, *args, **kwargs):
@@ -46,7 +71,7 @@ def app_client():
 @pytest.fixture
 def client(headless_client):
     if headless_client == "browser":
-        return Client()
+        return JSONClient()
     return AppClient()
 
 
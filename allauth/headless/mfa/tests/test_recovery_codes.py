@@ -14,7 +14,6 @@ def test_get_recovery_codes_requires_reauth(
     resp = auth_client.post(
         headless_reverse("headless:mfa:reauthenticate"),
         data={"code": rc.wrap().get_unused_codes()[0]},
-        content_type="application/json",
     )
     assert resp.status_code == 200
 
@@ -52,7 +51,6 @@ def test_generate_recovery_codes(
     with reauthentication_bypass():
         resp = auth_client.post(
             headless_reverse("headless:mfa:manage_recovery_codes"),
-            content_type="application/json",
         )
     assert resp.status_code == 200
     data = resp.json()
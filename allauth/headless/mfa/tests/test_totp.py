@@ -50,7 +50,6 @@ def test_activate_totp(
             resp = auth_client.post(
                 headless_reverse("headless:mfa:manage_totp"),
                 data={"code": "42"},
-                content_type="application/json",
             )
     assert resp.status_code == 200
     assert Authenticator.objects.filter(
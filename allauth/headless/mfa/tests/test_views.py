@@ -21,7 +21,6 @@ def test_auth_unverified_email_and_mfa(
             "email": user.email,
             "password": password,
         },
-        content_type="application/json",
     )
     assert resp.status_code == 401
     data = resp.json()
@@ -33,7 +32,6 @@ def test_auth_unverified_email_and_mfa(
     resp = client.post(
         headless_reverse("headless:account:verify_email"),
         data={"key": key},
-        content_type="application/json",
     )
     assert resp.status_code == 401
     flows = [
@@ -66,7 +64,6 @@ def test_auth_unverified_email_and_mfa(
     resp = client.post(
         headless_reverse("headless:mfa:authenticate"),
         data={"code": "bad"},
-        content_type="application/json",
     )
     assert resp.status_code == 400
     assert resp.json() == {
@@ -80,6 +77,5 @@ def test_auth_unverified_email_and_mfa(
         resp = client.post(
             headless_reverse("headless:mfa:authenticate"),
             data={"code": "bad"},
-            content_type="application/json",
         )
     assert resp.status_code == 200
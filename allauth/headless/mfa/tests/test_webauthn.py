@@ -13,7 +13,6 @@ def test_passkey_login(
         resp = client.post(
             headless_reverse("headless:mfa:login_webauthn"),
             data={"credential": credential},
-            content_type="application/json",
         )
     data = resp.json()
     assert data["data"]["user"]["id"] == passkey.user_id
@@ -60,7 +59,6 @@ def test_reauthenticate(
         resp = auth_client.post(
             headless_reverse("headless:mfa:reauthenticate_webauthn"),
             data={"credential": credential},
-            content_type="application/json",
         )
         assert resp.status_code == 200
     resp = auth_client.get(headless_reverse("headless:mfa:manage_recovery_codes"))
@@ -74,7 +72,6 @@ def test_update_authenticator(
     resp = auth_client.put(
         headless_reverse("headless:mfa:manage_webauthn"),
         data=data,
-        content_type="application/json",
     )
     # Reauthentication required
     assert resp.status_code == 401
@@ -82,7 +79,6 @@ def test_update_authenticator(
         resp = auth_client.put(
             headless_reverse("headless:mfa:manage_webauthn"),
             data=data,
-            content_type="application/json",
         )
     assert resp.status_code == 200
     passkey.refresh_from_db()
@@ -96,7 +92,6 @@ def test_delete_authenticator(
     resp = auth_client.delete(
         headless_reverse("headless:mfa:manage_webauthn"),
         data=data,
-        content_type="application/json",
     )
     # Reauthentication required
     assert resp.status_code == 401
@@ -104,7 +99,6 @@ def test_delete_authenticator(
         resp = auth_client.delete(
             headless_reverse("headless:mfa:manage_webauthn"),
             data=data,
-            content_type="application/json",
         )
     assert resp.status_code == 200
     assert not Authenticator.objects.filter(pk=passkey.pk).exists()
@@ -130,7 +124,6 @@ def test_add_authenticator(
             resp = auth_client.post(
                 headless_reverse("headless:mfa:manage_webauthn"),
                 data={"credential": credential},
-                content_type="application/json",
             )
             assert resp.status_code == 200
     assert (
@@ -155,7 +148,6 @@ def test_2fa_login(
             "username": user.username,
             "password": user_password,
         },
-        content_type="application/json",
     )
     assert resp.status_code == 401
     data = resp.json()
@@ -173,7 +165,6 @@ def test_2fa_login(
         resp = client.post(
             headless_reverse("headless:mfa:authenticate_webauthn"),
             data={"credential": credential},
-            content_type="application/json",
         )
     data = resp.json()
     assert resp.status_code == 200
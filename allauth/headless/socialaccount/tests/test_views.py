@@ -1,6 +1,7 @@
 import json
 from unittest.mock import patch
 
+from django.test.client import MULTIPART_CONTENT
 from django.urls import reverse
 
 from pytest_django.asserts import assertTemplateUsed
@@ -19,6 +20,7 @@ def test_bad_redirect(client, headless_reverse, db, settings):
             "callback_url": "https://unsafe.org/hack",
             "process": AuthProcess.LOGIN,
         },
+        content_type=MULTIPART_CONTENT,
     )
     assertTemplateUsed(resp, "socialaccount/authentication_error.html")
 
@@ -31,6 +33,7 @@ def test_valid_redirect(client, headless_reverse, db):
             "callback_url": "/",
             "process": AuthProcess.LOGIN,
         },
+        content_type=MULTIPART_CONTENT,
     )
     assert resp.status_code == 302
 
@@ -51,7 +54,6 @@ def test_manage_providers(auth_client, user, headless_reverse, provider_id):
     resp = auth_client.delete(
         headless_reverse("headless:socialaccount:manage_providers"),
         data={"provider": account_to_del.provider, "account": account_to_del.uid},
-        content_type="application/json",
     )
     assert resp.status_code == 200
     assert resp.json() == {
@@ -77,7 +79,6 @@ def test_disconnect_bad_request(auth_client, user, headless_reverse, provider_id
     resp = auth_client.delete(
         headless_reverse("headless:socialaccount:manage_providers"),
         data={"provider": provider_id, "account": "unknown"},
-        content_type="application/json",
     )
     assert resp.status_code == 400
     assert resp.json() == {
@@ -103,7 +104,6 @@ def test_valid_token(client, headless_reverse, db):
             },
             "process": AuthProcess.LOGIN,
         },
-        content_type="application/json",
     )
     assert resp.status_code == 200
     assert EmailAddress.objects.filter(email="a@b.com", verified=True).exists()
@@ -120,7 +120,6 @@ def test_invalid_token(client, headless_reverse, db, google_provider_settings):
             },
             "process": AuthProcess.LOGIN,
         },
-        content_type="application/json",
     )
     assert resp.status_code == 400
     data = resp.json()
@@ -201,7 +200,6 @@ def test_token_signup_closed(client, headless_reverse, db):
                 },
                 "process": AuthProcess.LOGIN,
             },
-            content_type="application/json",
         )
         assert resp.status_code == 403
     assert not EmailAddress.objects.filter(email="a@b.com", verified=True).exists()
@@ -225,7 +223,6 @@ def test_provider_signup(client, headless_reverse, db, settings):
             },
             "process": AuthProcess.LOGIN,
         },
-        content_type="application/json",
     )
     assert resp.status_code == 401
     pending_flow = [f for f in resp.json()["data"]["flows"] if f.get("is_pending")][0]
@@ -235,7 +232,6 @@ def test_provider_signup(client, headless_reverse, db, settings):
         data={
             "email": "a@b.com",
         },
-        content_type="application/json",
     )
     assert resp.status_code == 401
     pending_flow = [f for f in resp.json()["data"]["flows"] if f.get("is_pending")][0]
@@ -261,7 +257,6 @@ def test_signup_closed(client, headless_reverse, db, settings):
             },
             "process": AuthProcess.LOGIN,
         },
-        content_type="application/json",
     )
     assert resp.status_code == 401
     pending_flow = [f for f in resp.json()["data"]["flows"] if f.get("is_pending")][0]
@@ -275,7 +270,6 @@ def test_signup_closed(client, headless_reverse, db, settings):
             data={
                 "email": "a@b.com",
             },
-            content_type="application/json",
         )
     assert resp.status_code == 403
 
@@ -289,6 +283,7 @@ def test_connect(user, auth_client, sociallogin_setup_state, headless_reverse, d
         data={
             "id": 123,
         },
+        content_type=MULTIPART_CONTENT,
     )
     assert resp.status_code == 302
     assert resp["location"] == "/foo"
@@ -310,6 +305,7 @@ def test_connect_already_connected(
         data={
             "id": 123,
         },
+        content_type=MULTIPART_CONTENT,
     )
     # We're redirected, and an error code is shown.
     assert resp.status_code == 302
@@ -336,7 +332,6 @@ def test_token_connect(user, auth_client, headless_reverse, db):
             },
             "process": AuthProcess.CONNECT,
         },
-        content_type="application/json",
     )
     assert resp.status_code == 200
     assert SocialAccount.objects.filter(uid="123", user=user).exists()
@@ -364,7 +359,6 @@ def test_token_connect_already_connected(
             },
             "process": AuthProcess.CONNECT,
         },
-        content_type="application/json",
     )
     assert not SocialAccount.objects.filter(uid="123", user=user).exists()
     assert resp.status_code == 400
@@ -385,6 +379,5 @@ def test_provider_signup_not_pending(client, headless_reverse, db, settings):
         data={
             "email": "a@b.com",
         },
-        content_type="application/json",
     )
     assert resp.status_code == 409
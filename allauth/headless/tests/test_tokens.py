@@ -23,7 +23,6 @@ def test_access_token(
             "username": user.username,
             "password": user_password,
         },
-        content_type="application/json",
     )
     data = resp.json()
     assert data["status"] == 200
@@ -9,7 +9,6 @@ def test_flow(client, user, user_password, headless_reverse, settings):
             "email": user.email,
             "password": user_password,
         },
-        content_type="application/json",
     )
     assert resp.status_code == 200
     resp = client.get(headless_reverse("headless:usersessions:sessions"))
@@ -21,7 +20,6 @@ def test_flow(client, user, user_password, headless_reverse, settings):
     resp = client.delete(
         headless_reverse("headless:usersessions:sessions"),
         data={"sessions": [session_pk]},
-        content_type="application/json",
     )
     assert resp.status_code == 401
     assert not UserSession.objects.filter(pk=session_pk).exists()